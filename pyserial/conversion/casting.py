@@ -1,57 +1,86 @@
 import datetime
+from collections.abc import Iterable
 # noinspection PyUnresolvedReferences
-from typing import List, Union, Optional, Iterable, Any, Callable, TypeVar, get_origin, Tuple
+from typing import Union, Optional, Any, Callable, TypeVar, get_origin, Tuple, Dict, List, Sequence
 
 from pyserial.conversion.enum_conversion import SerializableEnum
-from pyserial.conversion.serialization import SerialDict, serializer_func
-from pyserial.conversion.type_processing import type_to_list
+from pyserial.conversion.serialization import SerialDict, SerialType, serializer_func
+from pyserial.conversion.type_processing import type_to_list, cache_hashable, get_deepest_superclass
 
 T = TypeVar("T")
 Caster = Callable[[Any], T]
 
-_CASTERS: List[Tuple[type, Optional[Callable[[Union[str, int, float, list, SerialDict]], Any]]]] = [
-	(type(None), None),
-	(str, None),
-	(int, None),
-	(float, None),
+_CASTERS: Dict[type, Optional[Callable[[SerialType], Any]]] = {
+	str: None,
+	int: None,
+	float: None,
+}
+"""The existing casters by the type they correspond to.
+They do not need any particular order, as `_get_caster()` finds the deepest, matching subclass by the MRO.
 
-]
-"""The list of existing serializers.
-Each item is a tuple with the first item being the type this
- serializer corresponds to and the the second being the serializer itself.
-They are ordered in such a way, that subclassses of any class always come before that class.
+For `str`, `int` and `float`, the caster is `None` as these types can be used as casters themselves.
 
-For `str`, `int` and `float`, the serializer is `None` as these values can be serialized as they are.
+Only use `add_caster()`/`@caster_func()` to add entries, so the cache of `get_caster()` gets cleared as well."""
+_CASTER_LISTENERS: List[Callable[[], None]] = list()
+"""The functions to call after `add_caster()` changed `_CASTERS`, see `on_add_caster()`."""
+_MISSING = object()
 
-To retain that order, only use `add_serializer()`/`@serializer_func()` to add entries to this list."""
 
+def add_caster(type_: type, caster: Callable[[SerialType], Any]):
+	"""Adds the `caster` for the `type_` to `_CASTERS`, replacing any existing caster for that type.
+	Also clears the cache of `get_caster()` and notifies the listeners of `on_add_caster()`,
+	as the casters created so far might be outdated now."""
+	_CASTERS[type_] = caster
+	_create_cached_caster.cache_clear()
+	for listener in _CASTER_LISTENERS:
+		listener()
 
-def add_caster(type_: type, caster: Callable[[Union[str, int, float, list, SerialDict]], Any]):
-	"""Adds the `caster` for the `type_` to `_CASTERS` while retaining the desired order of that list."""
-	for index, (compare_type, _) in enumerate(_CASTERS):
-		if compare_type is None:
-			continue
-		if compare_type == type_:
-			_CASTERS[index] = (type_, caster)
-			return
-		elif issubclass(type_, compare_type):
-			_CASTERS.insert(index, (type_, caster))
-			return
-	_CASTERS.append((type_, caster))
+
+def on_add_caster(listener: Callable[[], None]) -> Callable[[], None]:
+	"""Registers the `listener` to be called whenever `add_caster()` changed the casters.
+	Use this to drop anything built from casters of `get_caster()`, as these might be outdated then.
+	Returns the `listener`, so this can be used as decorator."""
+	_CASTER_LISTENERS.append(listener)
+	return listener
 
 
-def _get_caster(type_: type) -> Optional[Callable[[Union[str, int, float, list, SerialDict]], Any]]:
+def _get_caster(type_: type) -> Optional[Callable[[SerialType], Any]]:
 	"""Gets the caster for the `type_` if listed in `_CASTERS`.
 
 	Returns `None` if there is no registered caster for this type.
 
 	When there are multiple possible casters defined due to subclassing,
 	the deepest, matching subclass is taken for the deserializer."""
-	for key, caster in _CASTERS:
-		# ↑ The promise of returning the deepest, matching subclass is granted by the order of `_SERIALIZERS`.
-		if issubclass(type_, key):
+	try:
+		caster = _CASTERS.get(type_, _MISSING)
+	except TypeError:
+		# ↑ Types that cannot be hashed (e.g. due to a metaclass defining `__eq__`) cannot be registered.
+		caster = _MISSING
+	if caster is not _MISSING:
+		# ↑ Most types are registered themselves, so their MRO does not need to be walked at all.
+		return caster
+	for base in getattr(type_, "__mro__", ())[1:]:
+		# ↑ The promise of returning the deepest, matching subclass is granted by the order of the MRO.
+		try:
+			caster = _CASTERS.get(base, _MISSING)
+		except TypeError:
+			continue
+		if caster is not _MISSING:
 			return caster
-	return None
+	# The MRO does not contain the ABCs the `type_` is only registered with, so these are checked last.
+	superclass = get_deepest_superclass(type_, _CASTERS)
+	return None if superclass is None else _CASTERS[superclass]
+
+
+_CONTAINER_TYPES = (list, tuple, set, frozenset)
+"""The most common iterables whose items can be cast. Subclasses of these count as well."""
+
+
+def _is_container(type_: type) -> bool:
+	"""Checks if the `type_` is an iterable whose items can be cast.
+	The `_CONTAINER_TYPES` are checked first, as checking against `Iterable` has to consult the ABC registry.
+	Strings are iterable as well, but are never treated as containers."""
+	return issubclass(type_, _CONTAINER_TYPES) or (issubclass(type_, Iterable) and not issubclass(type_, str))
 
 
 def caster_func(*types: type):
@@ -82,7 +111,15 @@ def get_caster(type_: T) -> Caster[T]:
 	- For Serializable, this is `.deserialize`
 	- For simple types, this is the type itself
 	- For generic types, this is a dedicated caster to cast nested types (See `get_caster_for_generic_type`).
+
+	The casters are cached per type, so each caster only gets created once.
+	Types that cannot be hashed are not cached, see `cache_hashable()`.
 	"""
+	return _create_cached_caster(type_)
+
+
+def _create_caster(type_: T) -> Caster[T]:
+	"""Creates the caster for `get_caster()`."""
 	from pyserial.serializable import Serializable
 	# region: Delegate caster acquisition depending on the type.
 	# In the first case, the type is simple and can be used as caster as-is.
@@ -106,6 +143,9 @@ def get_caster(type_: T) -> Caster[T]:
 	return caster
 
 
+_create_cached_caster = cache_hashable(_create_caster)
+
+
 def get_caster_for_generic_type(type_: T) -> Caster[T]:
 	"""Creates a caster based on a generic type (a parameterized type like `list[str]`).
 	The caster will cast iterables nested into each other and their final items into the types defined by the
@@ -137,7 +177,7 @@ def get_caster_for_generic_type(type_: T) -> Caster[T]:
 	return caster
 
 
-def get_caster_from_type_list(types: Iterable[Union[type, Tuple[type, None]]]) -> Caster:
+def get_caster_from_type_list(types: Sequence[Union[type, Tuple[type, None]]]) -> Caster:
 	"""Creates a caster based on a list of types.
 	The caster will cast iterables nested into each other and their final items into the types defined by the
 	`types`.
@@ -163,24 +203,52 @@ def get_caster_from_type_list(types: Iterable[Union[type, Tuple[type, None]]]) -
 		For optional types, you can provide a tuple as item in the list as such: `(your_type, None)`.
 	"""
 
-	current_type, *types = types
+	# The casters are created from the lowest level upwards, so each level can wrap the caster of the level below it.
+	# This way, the `types` are only processed once when creating the caster and not again for every cast value.
+	caster = None
 	optional = False
-	if isinstance(current_type, tuple):
-		current_type, _ = current_type
-		optional = True
-
-	def inner(value: Any):
-		if issubclass(current_type, Iterable) and not issubclass(current_type, str):
-			items = [get_caster_from_type_list(types)(item) for item in value]
-			casted = get_caster(current_type)(items)
+	for type_ in reversed(tuple(types)):
+		items_optional = optional
+		optional = isinstance(type_, tuple)
+		if optional:
+			type_, _ = type_
+
+		if caster is not None and _is_container(type_):
+			caster = _iterable_caster(get_caster(type_), caster, items_optional)
 		else:
-			casted = get_caster(current_type)(value)
-		return casted
+			caster = get_caster(type_)
 
+	if caster is None:
+		raise ValueError("Cannot create a caster from an empty list of types.")
 	if optional:
-		return optional_caster(inner)
+		caster = optional_caster(caster)
+	return caster
+
+
+def _iterable_caster(iterable_caster: Caster[T], item_caster: Caster, optional_items: bool = False) -> Caster[T]:
+	"""Creates a caster that casts all items of an iterable with the `item_caster`
+	and then the iterable itself with the `iterable_caster`.
+
+	With `optional_items`, items that are `None` will be retained as `None`.
+	This is checked inline instead of wrapping the `item_caster` with `optional_caster()`,
+	which saves a call for every item."""
+
+	if iterable_caster is list:
+		# ↑ The comprehension already creates the list, so it does not need to be cast again.
+		if optional_items:
+			def inner(value: Any):
+				return [None if item is None else item_caster(item) for item in value]
+		else:
+			def inner(value: Any):
+				return [item_caster(item) for item in value]
+	elif optional_items:
+		def inner(value: Any):
+			return iterable_caster([None if item is None else item_caster(item) for item in value])
 	else:
-		return inner
+		def inner(value: Any):
+			return iterable_caster([item_caster(item) for item in value])
+
+	return inner
 
 
 @caster_func(datetime.datetime)
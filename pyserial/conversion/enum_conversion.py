@@ -24,7 +24,11 @@ class SerializableEnum(Enum):
     @classmethod
     def deserialize(cls: Type[T], value: Any) -> T:
         """The method to cast a `value` into a member. Default is value-to-member."""
-        return cls(value)
+        try:
+            return cls._value2member_map_[value]
+        except (KeyError, TypeError):
+            # ↑ Values that are unhashable or handled by `_missing_()` are left to the full lookup of `Enum`.
+            return cls(value)
 
 
 class SerializableEnumByName(SerializableEnum):
@@ -38,7 +42,7 @@ class SerializableEnumByName(SerializableEnum):
     @classmethod
     def deserialize(cls: Type[T], value: str) -> T:
         """Returns the member of this Enum based on the `.name` corresponding to the `value`."""
-        return cls[value]
+        return cls._member_map_[value]
 
 
 @serializer_func(SerializableEnum)
@@ -1,58 +1,103 @@
 """Functions and data to handle the serialization process itself.
 Also stores the `_SERIALIZERS` used in the process."""
+from __future__ import annotations
+
 import datetime
 from enum import Enum
 from pathlib import Path
 # noinspection PyUnresolvedReferences
-from typing import Union, Optional, Callable, Any, Iterable, Dict, List, Tuple
+from typing import Union, Optional, Callable, Any, Iterable, Dict, Set
+
+from pyserial.conversion.type_processing import get_deepest_superclass
 
 SerialDict = Dict[str, Union[str, int, float, list, dict]]
 SerialTypes = [str, int, float, list, SerialDict]
-_SERIALIZERS: List[Tuple[type, Optional[Callable[[Any], Union[str, int, float, list, SerialDict]]]]] = [
-    (type(None), None),
-    (str, None),
-    (int, None),
-    (float, None),
-
-]
-"""The list of existing serializers.
-Each item is a tuple with the first item being the type this
- serializer corresponds to and the the second being the serializer itself.
-They are ordered in such a way, that subclassses of any class always come before that class.
+SerialType = Union[str, int, float, list, SerialDict]
+"""A single value in serialized form. Use this instead of spelling out the `Union` in annotations."""
+_SERIALIZERS: Dict[type, Optional[Callable[[Any], SerialType]]] = {
+    type(None): None,
+    str: None,
+    int: None,
+    float: None,
+}
+"""The existing serializers by the type they correspond to.
+They do not need any particular order, as `get_serializer()` finds the deepest, matching subclass by the MRO.
 
 For `str`, `int` and `float`, the serializer is `None` as these values can be serialized as they are.
 
-To retain that order, only use `add_serializer()`/`@serializer_func()` to add entries to this list."""
+Only use `add_serializer()`/`@serializer_func()` to add entries, so the cached lookups get updated as well."""
+_SERIALIZER_CACHE: Dict[type, Optional[Callable[[Any], SerialType]]] = dict()
+"""The serializers found by `get_serializer()` by the exact type they were requested for.
+Gets cleared by `add_serializer()`, as the found serializers might be outdated then."""
+_PASSTHROUGH_TYPES: Set[type] = set()
+"""The types out of `_SERIALIZER_CACHE` whose serializer is `None`, meaning their values can be serialized as they are.
+This lets `serialize()` return these values without even calling `get_serializer()`.
+It is not a fixed set of `str`, `int` etc., as their serializers can still be replaced with `add_serializer()`."""
+_MISSING = object()
+
 
+def add_serializer(type_: type, serializer: Callable[[Any], SerialType]):
+    """Adds the `serializer` for the `type_` to `_SERIALIZERS`, replacing any existing serializer for that type."""
+    _SERIALIZERS[type_] = serializer
+    _SERIALIZER_CACHE.clear()
+    _PASSTHROUGH_TYPES.clear()
 
-def add_serializer(type_: type, serializer: Callable[[Any], Union[str, int, float, list, SerialDict]]):
-    """Adds the `serializer` for the `type_` to `SERIALIZERS` while retaining the desired order of that list."""
-    for index, (compare_type, _) in enumerate(_SERIALIZERS):
-        if compare_type is None:
-            continue
-        if compare_type == type_:
-            _SERIALIZERS[index] = (type_, serializer)
-            return
-        elif issubclass(type_, compare_type):
-            _SERIALIZERS.insert(index, (type_, serializer))
-            return
-    _SERIALIZERS.append((type_, serializer))
+
+def _reset_serializers():
+    """Removes all serializers from `_SERIALIZERS` together with the cached lookups.
+    Only meant for tests that need to start without any serializers."""
+    _SERIALIZERS.clear()
+    _SERIALIZER_CACHE.clear()
+    _PASSTHROUGH_TYPES.clear()
 
 
 def get_serializer(type_: type):
     """Gets the serializer for the `value`.
     When there are multiple possible serializers defined due to subclassing,
-     the deepest, matching subclass is taken for the deserializer."""
-    for key, serializer in _SERIALIZERS:
-        # ↑ The promise of returning the deepest, matching subclass is granted by the order of `_SERIALIZERS`.
-        if issubclass(type_, key):
-            return serializer
-    raise ValueError(f"There is no serializer defined for `{type_}`")
+     the deepest, matching subclass is taken for the deserializer.
+    The found serializers are cached by their type, see `_SERIALIZER_CACHE`."""
+    try:
+        return _SERIALIZER_CACHE[type_]
+    except KeyError:
+        pass
+    for base in type_.__mro__:
+        # ↑ The promise of returning the deepest, matching subclass is granted by the order of the MRO.
+        serializer = _SERIALIZERS.get(base, _MISSING)
+        if serializer is not _MISSING:
+            break
+    else:
+        # ↑ The MRO does not contain the ABCs the `type_` is only registered with, so these are checked last.
+        superclass = get_deepest_superclass(type_, _SERIALIZERS)
+        if superclass is None:
+            raise ValueError(f"There is no serializer defined for `{type_}`")
+        serializer = _SERIALIZERS[superclass]
+    _SERIALIZER_CACHE[type_] = serializer
+    if serializer is None:
+        _PASSTHROUGH_TYPES.add(type_)
+    return serializer
 
 
-def serialize(value: Any) -> SerialTypes:
-    """Recursively serialize the value. Uses the serializers defined in `_SERIALIZERS`."""
-    serializer = get_serializer(type(value))
+def get_passthrough_types() -> Set[type]:
+    """Gets the types whose values can be serialized as they are, see `_PASSTHROUGH_TYPES`.
+    The set is updated in place, so it can be kept to check values against it later.
+    It must not be modified by the caller."""
+    return _PASSTHROUGH_TYPES
+
+
+def serialize(
+        value: Any,
+        _get_serializer: Callable[[type], Optional[Callable[[Any], SerialType]]] = get_serializer,
+        _passthrough_types: Set[type] = _PASSTHROUGH_TYPES,
+) -> SerialType:
+    """Recursively serialize the value. Uses the serializers defined in `_SERIALIZERS`.
+    The type of the value is read from `.__class__`, which is faster than `type()`.
+    This assumes that `.__class__` is not overridden, which holds for the data classes this is meant for.
+
+    The other parameters only bind the globals used for every value as locals and are not meant to be passed."""
+    type_ = value.__class__
+    if type_ in _passthrough_types:
+        return value
+    serializer = _get_serializer(type_)
     if serializer is None:
         return value
     else:
@@ -71,12 +116,10 @@ def serializer_func(*types: type):
 
 
 @serializer_func(list, tuple)
-def run(iterable: Iterable) -> list:
-    """Lists and tuples will both be cast into a `list` and their items will be serialized."""
-    new = list()
-    for item in iterable:
-        new.append(serialize(item))
-    return new
+def run(iterable: Iterable, _serialize: Callable[[Any], SerialType] = serialize) -> list:
+    """Lists and tuples will both be cast into a `list` and their items will be serialized.
+    `serialize()` is bound as default argument so it is a local instead of a global lookup for every item."""
+    return [_serialize(item) for item in iterable]
 
 @serializer_func(datetime.datetime)
 def run(date: datetime.datetime) -> str:
@@ -1,12 +1,57 @@
 """Helps in handling complex, nested types.
 Primary content is the function `type_to_list()` to convert nested types into a more native format.
 """
+from functools import lru_cache, wraps
 # noinspection PyUnresolvedReferences
-from typing import Union, Optional, get_args, get_origin, Tuple
-
-
-def type_to_list(type_: type):
-    """Converts nested types into a flat list of these nestings.
+from typing import Union, Optional, Callable, TypeVar, Iterable, get_args, get_origin, Tuple
+
+T = TypeVar("T")
+
+
+def cache_hashable(func: Callable[[type], T]) -> Callable[[type], T]:
+    """Caches the results of the `func` by its type argument like `lru_cache()`.
+    Some types cannot be hashed (e.g. `Annotated` with unhashable metadata), so these bypass the cache instead of
+    raising a `TypeError`.
+    Like with `lru_cache()`, the cache can be cleared with `.cache_clear()`."""
+    cached_func = lru_cache(maxsize=None)(func)
+
+    @wraps(func)
+    def inner(type_: type) -> T:
+        try:
+            return cached_func(type_)
+        except TypeError:
+            # ↑ Hashing is only checked here, so hashable types do not get hashed twice.
+            try:
+                hash(type_)
+            except TypeError:
+                return func(type_)
+            raise
+
+    inner.cache_clear = cached_func.cache_clear
+    return inner
+
+
+def get_deepest_superclass(type_: type, superclasses: Iterable[type]) -> Optional[type]:
+    """Gets the deepest of the `superclasses` that the `type_` is a subclass of according to `issubclass()`.
+    In contrast to walking the MRO of the `type_`, this also finds ABCs the `type_` is only registered with.
+
+    Returns `None` if the `type_` is no subclass of any of the `superclasses` or is no class at all."""
+    if not isinstance(type_, type):
+        return None
+    deepest = None
+    for superclass in superclasses:
+        try:
+            if issubclass(type_, superclass) and (deepest is None or issubclass(superclass, deepest)):
+                deepest = superclass
+        except TypeError:
+            # ↑ ABCs cache the checked classes, so they cannot check classes that cannot be hashed.
+            continue
+    return deepest
+
+
+@cache_hashable
+def type_to_list(type_: type) -> Tuple[Union[type, Tuple[type, None]], ...]:
+    """Converts nested types into a flat tuple of these nestings.
     Unions will not be converted as this would potentially cause non-flat lists.
     The only exception are optional types, which will result in their type being expressed as a tuple `(<type>, None)`.
 
@@ -14,42 +59,47 @@ def type_to_list(type_: type):
     ===========
     Only works for types which nest a singular type, i.e. `list` but not `dict`.
 
+    The results are cached, which is why they are returned as immutable tuple.
+
     Examples
     ========
     type_to_list(list[str])
-    [list, str]
+    (list, str)
     type_to_list(tuple[Optional[int]])
-    [tuple, (int, None)]
+    (tuple, (int, None))
 
 
     :raises ValueError:
         When there is a non-optional union in the type.
     """
-    if is_singular_optional(type_):
-        type_ = next(arg for arg in get_args(type_) if arg is not type(None))
-        type_tuple = [(get_type_class(type_), None)]
-    else:
-        type_tuple = [get_type_class(type_)]
-
-    nested_types = get_args(type_)
-    if len(nested_types) == 1:
-        type_tuple += type_to_list(get_args(type_)[0])
-    elif len(nested_types) > 1:
-        raise ValueError("Can only create linear lists, so Unions (Except with `NoneType`) are prohibited.")
-
-    return type_tuple
-
-
+    type_list = list()
+    # Each iteration processes one level of the nesting, from the outermost level inwards.
+    while True:
+        origin = get_origin(type_)
+        nested_types = get_args(type_)
+        if origin is Union and len(nested_types) == 2 and type(None) in nested_types:
+            # ↑ Same check as `is_singular_optional()`, but using the origin and arguments acquired anyway.
+            type_ = nested_types[0] if nested_types[1] is type(None) else nested_types[1]
+            nested_types = get_args(type_)
+            type_list.append((get_type_class(type_), None))
+        else:
+            type_list.append(type_ if origin is None else origin)
+
+        if len(nested_types) > 1:
+            raise ValueError("Can only create linear lists, so Unions (Except with `NoneType`) are prohibited.")
+        if not nested_types:
+            return tuple(type_list)
+        type_ = nested_types[0]
+
+
+@cache_hashable
 def get_type_class(type_: type):
     """Get the simple origin of a generic type.
     In contrast to `typing.get_origin()`,
     this returns `type_` if `type_` has no origin (Meaning `type_` is a simple type).
     """
     origin = get_origin(type_)
-    if origin is None:
-        return type_
-    else:
-        return get_origin(type_)
+    return type_ if origin is None else origin
 
 
 def is_optional(type_: type) -> bool:
@@ -69,10 +119,13 @@ def is_singular_optional(type_: type) -> bool:
      - If the type is optional, meaning `None` is a valid type for it.
      - The type just consists of two types, `None` and a singular not-`None` type in this case.
     It does not matter whether the `None` was added by `Optional` or `Union`."""
-    if len(get_args(type_)) != 2:
+    # Same as `is_optional()` plus the check for the number of arguments, but without getting the arguments twice.
+    if get_origin(type_) is not Union:
+        return False
+    args = get_args(type_)
+    if len(args) != 2:
         return False
-    else:
-        return is_optional(type_)
+    return type(None) in args
 
 
 if __name__ == '__main__':
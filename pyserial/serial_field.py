@@ -25,6 +25,9 @@ class SerialField(Field):
             nested iterables and a primitive type at the lowest level.
             For details, see `type_processing.type_to_list()`
     """
+    __slots__ = ("serialize", "caster")
+    # ↑ `Field` defines `__slots__` itself, so without these, every field would also carry a `__dict__`.
+
     if sys.version_info >= (3, 10):
         def __init__(
                 self, *, serialize=True, caster=None,
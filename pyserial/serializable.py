@@ -1,14 +1,22 @@
 """The `Serializable`-class.
 The main component of this library next to the corresponding `SerialField` in `serial_field.py`."""
 
-from dataclasses import dataclass, fields
+import sys
+from dataclasses import dataclass, fields, Field
+from types import SimpleNamespace
+from weakref import WeakSet
 # noinspection PyUnresolvedReferences
-from typing import Union, Optional, TypeVar, Callable, Any, Iterable, Type, List, Tuple
+from typing import (
+    Union, Optional, TypeVar, Callable, Any, Iterable, Iterator, Type, List, Tuple, Dict, get_args, get_type_hints
+)
 
-from pyserial.conversion.casting import get_caster
+from pyserial.conversion.casting import Caster, get_caster, on_add_caster
+from pyserial.conversion.type_processing import is_singular_optional
 
 from pyserial.serial_field import SerialField
-from pyserial.conversion.serialization import SerialDict, serialize, serializer_func
+from pyserial.conversion.serialization import SerialDict, serialize, serializer_func, get_passthrough_types
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -38,14 +46,7 @@ class Serializable:
     def serialize(self) -> SerialDict:
         """Converts this class with all its fields class
         that are a `SerialField` and have `serialize=True` into a `SerialDict`"""
-        data = dict()
-        for field_ in fields(self):
-            if not isinstance(field_, SerialField) or not field_.serialize:
-                continue
-            field_: SerialField
-            attr = self.__getattribute__(field_.name)
-            data[field_.name] = serialize(attr)
-        return data
+        return self._get_serializer()(self)
 
     @classmethod
     def deserialize(cls, data: SerialDict):
@@ -66,28 +67,148 @@ class Serializable:
         This process will *not* force the attributes onto an empty class but will
         actually call the constructor of the class with the deserialized values as arguments.
         """
-        deserialized_data = dict()
-        available_fields = [field_.name for field_ in fields(cls) if field_.init]
-        for field_ in fields(cls):
-            if not isinstance(field_, SerialField):
-                continue
-            if field_.name not in available_fields:
+        return cls._get_deserializer()(cls, data)
+
+    @classmethod
+    def _get_serializer(cls) -> Callable[["Serializable"], SerialDict]:
+        """Gets the function that does the actual work of `.serialize()` for this class.
+
+        The function is generated on first use and then stored on the class itself.
+        Its code accesses and serializes each field directly, so no loop or lookup of the fields is left.
+        Values that can be serialized as they are (see `get_passthrough_types()`) are even returned without calling
+        `serialize()` at all.
+        It cannot be generated in `__init_subclass__()` already, as the `dataclass`-decorator
+        only adds the fields after the class has been created."""
+        # The function is looked up in the `__dict__` so subclasses do not use the function of their superclass.
+        serializer = cls.__dict__.get("_serializer")
+        if serializer is None:
+            lines = list()
+            items = list()
+            for index, name in enumerate(cls._create_serialize_plan()):
+                lines.append(f"_value_{index} = self.{name}")
+                items.append(
+                    f"{name!r}: _value_{index} if _value_{index}.__class__ in _passthrough_types"
+                    f" else _serialize(_value_{index})"
+                )
+            lines.append(f"return {{{', '.join(items)}}}")
+            serializer = _create_function(
+                cls, "serialize", ("self",), lines,
+                {"_serialize": serialize, "_passthrough_types": get_passthrough_types()}
+            )
+            cls._serializer = serializer
+        return serializer
+
+    @classmethod
+    def _get_deserializer(cls) -> Callable[[Type[T], SerialDict], T]:
+        """Gets the function that does the actual work of `.deserialize()` for this class.
+        Like for `_get_serializer()`, the function is generated on first use and casts each field directly.
+        As it contains the casters of the fields, it gets removed again when `add_caster()` changes the casters."""
+        deserializer = cls.__dict__.get("_deserializer")
+        if deserializer is None:
+            namespace = dict()
+            arguments = list()
+            for index, (name, caster, optional) in enumerate(cls._create_deserialize_plan()):
+                namespace[f"_caster_{index}"] = caster
+                if optional:
+                    arguments.append(f"{name}=None if data[{name!r}] is None else _caster_{index}(data[{name!r}])")
+                else:
+                    arguments.append(f"{name}=_caster_{index}(data[{name!r}])")
+            deserializer = _create_function(
+                cls, "deserialize", ("cls", "data"), [f"return cls({', '.join(arguments)})"], namespace
+            )
+            cls._deserializer = deserializer
+            _CLASSES_WITH_DESERIALIZER.add(cls)
+        return deserializer
+
+    @classmethod
+    def _create_serialize_plan(cls) -> Iterator[str]:
+        """Yields the names of the fields to serialize."""
+        for field_ in cls._get_serial_fields():
+            if field_.serialize:
+                yield field_.name
+
+    @classmethod
+    def _create_deserialize_plan(cls) -> Iterator[Tuple[str, Caster, bool]]:
+        """Yields the names of the fields to deserialize together with their casters
+        and whether `None` must be retained before calling the caster."""
+        for field_ in cls._get_serial_fields():
+            if not field_.init:
                 continue
-            field_: SerialField
 
+            optional = False
             if field_.caster is not None:
                 caster = field_.caster
             else:
+                type_ = cls._resolve_type(field_)
+                if is_singular_optional(type_):
+                    # ↑ `None` is then checked by the deserializer itself, which saves wrapping the caster.
+                    type_ = next(arg for arg in get_args(type_) if arg is not type(None))
+                    optional = True
                 try:
-                    caster = get_caster(field_.type)
+                    caster = get_caster(type_)
                 except ValueError:
                     raise ValueError(
                         f"There were issues trying to get an implicit deserializer for the field {field_.name}.\n"
                         "Define an explicit `deserializer` to suit your needs."
                     )
+            yield field_.name, caster, optional
+
+    @classmethod
+    def _resolve_type(cls, field_: Field) -> Any:
+        """Gets the type of the `field_` with its annotation resolved,
+        as it might be a string (e.g. due to `from __future__ import annotations`) or contain forward references.
+        The annotation is resolved in the namespace of the class that defines it, like `get_type_hints()` does.
+
+        Only the annotation of the `field_` is resolved, so other fields with annotations that cannot be resolved
+        have no effect on it. If it cannot be resolved itself, it is returned as it is."""
+        for base in cls.__mro__:
+            if field_.name in base.__dict__.get("__annotations__", {}):
+                break
+        else:
+            return field_.type
+        try:
+            resolved = get_type_hints(
+                SimpleNamespace(__annotations__={field_.name: field_.type}),
+                vars(sys.modules[base.__module__]), dict(vars(base)),
+            )
+        except Exception:
+            # ↑ Evaluating the annotation can raise anything, e.g. a `NameError` for undefined names.
+            return field_.type
+        return resolved[field_.name]
+
+    @classmethod
+    def _get_serial_fields(cls) -> Iterator[SerialField]:
+        """Yields the fields of this class that are a `SerialField`.
+        This is the only place where the fields are checked for their type,
+        which only happens once per class when the plans are created."""
+        for field_ in fields(cls):
+            if isinstance(field_, SerialField):
+                yield field_
+
+
+_CLASSES_WITH_DESERIALIZER: "WeakSet[Type[Serializable]]" = WeakSet()
+"""The classes which currently store a deserializer generated by `Serializable._get_deserializer()`."""
+
+
+@on_add_caster
+def _remove_deserializers():
+    """Removes the generated deserializers from all classes, so they get generated again with the current casters."""
+    for cls in _CLASSES_WITH_DESERIALIZER:
+        del cls._deserializer
+    _CLASSES_WITH_DESERIALIZER.clear()
+
 
-            deserialized_data[field_.name] = caster(data[field_.name])
-        return cls(**deserialized_data)
+def _create_function(
+        cls: type, name: str, parameters: Tuple[str, ...], lines: List[str], namespace: Dict[str, Any]
+) -> Callable:
+    """Creates a function for the `cls` from the source code `lines` of its body.
+    The `namespace` is used as the globals of the function."""
+    body = "".join(f"    {line}\n" for line in lines)
+    source = f"def {name}({', '.join(parameters)}):\n{body}"
+    exec(source, namespace)
+    function = namespace[name]
+    function.__qualname__ = f"{cls.__qualname__}.{name}"
+    return function
 
 
 @serializer_func(Serializable)
@@ -1,9 +1,12 @@
+import sys
+from abc import ABC
+from collections import deque
 from dataclasses import dataclass
 # noinspection PyUnresolvedReferences
-from typing import Union, Optional, Any, Iterable, Tuple
+from typing import Union, Optional, Any, Iterable, Tuple, Deque, List
 from unittest.mock import Mock
 
-from pyserial.conversion.casting import optional_caster, get_caster_from_type_list
+from pyserial.conversion.casting import optional_caster, get_caster_from_type_list, get_caster, add_caster
 
 
 def test_optional_caster():
@@ -96,6 +99,97 @@ def test_get_caster_from_type_list():
         test(test_set_)
 
 
+def test_get_caster_after_add_caster():
+    """Gets the caster for a class before and after adding a caster for it
+    and expects the cached caster to be replaced by the added one."""
+    class A:
+        ...
+
+    def caster(_):
+        return 1
+
+    assert get_caster(A) is A
+    add_caster(A, caster)
+    assert get_caster(A) is caster
+
+
+def test_get_caster_superclass():
+    """Adds casters for a class and its subclass and expects each subclass
+    to get the caster of its deepest superclass with a caster."""
+    class A:
+        ...
+
+    class AB(A):
+        ...
+
+    class ABC(AB):
+        ...
+
+    def caster_a(_):
+        return 1
+
+    def caster_ab(_):
+        return 2
+
+    add_caster(AB, caster_ab)
+    add_caster(A, caster_a)
+    assert get_caster(A) is caster_a
+    assert get_caster(AB) is caster_ab
+    assert get_caster(ABC) is caster_ab
+
+
+def test_get_caster_other_iterable():
+    """Gets the caster for an iterable that is no builtin container and expects its items to be cast as well."""
+    assert get_caster(Deque[int])(["1", "2"]) == deque([1, 2])
+
+
+def test_get_caster_unhashable():
+    """Gets the caster for types that cannot be hashed and expects no `TypeError` to leak.
+    Unhashable classes are used as caster like any other class,
+    while unhashable annotations that cannot be cast raise a `ValueError`."""
+    class Meta(type):
+        def __eq__(self, other):
+            return self is other
+        # ↑ Defining `__eq__` without `__hash__` makes the classes of this metaclass unhashable.
+
+    class A(metaclass=Meta):
+        def __init__(self, value):
+            self.value = value
+
+    assert get_caster(A) is A
+    assert get_caster(List[A])(["1"])[0].value == "1"
+
+    if sys.version_info >= (3, 9):
+        from typing import Annotated
+        try:
+            get_caster(List[Annotated[int, []]])
+        except ValueError:
+            ...
+        else:
+            raise AssertionError()
+
+
+
+def test_get_caster_registered_subclass():
+    """Adds a caster for an ABC and expects a class that is only registered with that ABC to get its caster."""
+    class A(ABC):
+        ...
+
+    class B:
+        ...
+
+    def caster(_):
+        return 1
+
+    A.register(B)
+    add_caster(A, caster)
+    assert get_caster(B) is caster
+
 if __name__ == '__main__':
     test_optional_caster()
     test_get_caster_from_type_list()
+    test_get_caster_after_add_caster()
+    test_get_caster_superclass()
+    test_get_caster_other_iterable()
+    test_get_caster_unhashable()
+    test_get_caster_registered_subclass()
@@ -0,0 +1,54 @@
+"""Tests for classes whose annotations are strings due to `from __future__ import annotations`.
+The classes are defined on module level, so their annotations can be resolved from the module."""
+from __future__ import annotations
+
+import datetime
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+# noinspection PyUnresolvedReferences
+from typing import Union, Optional, List, Tuple
+
+from pyserial import SerialField, Serializable
+
+
+@dataclass
+class Inner(Serializable):
+    a: Path = SerialField()
+
+
+@dataclass
+class Outer(Serializable):
+    a: List[Inner] = SerialField()
+    b: Optional[Inner] = SerialField()
+    c: Tuple[datetime.datetime] = SerialField()
+    d: Optional[int] = SerialField()
+
+
+@dataclass
+class Unresolvable(Serializable):
+    a: Path = SerialField()
+    b: os.NoSuchThing = field(default=None)
+    # ↑ Cannot be resolved, but is no `SerialField` either.
+
+
+def test_round_trip():
+    """Serializes and deserializes a class with string annotations
+    and expects the annotations to be resolved into their casters."""
+    outer = Outer([Inner(Path("a"))], Inner(Path("b")), (datetime.datetime(2020, 1, 2),), None)
+    data = outer.serialize()
+    assert data == {"a": [{"a": "a"}], "b": {"a": "b"}, "c": ["2020-01-02T00:00:00"], "d": None}
+    assert Outer.deserialize(data) == outer
+    assert Outer.deserialize({"a": [], "b": None, "c": [], "d": "1"}) == Outer([], None, (), 1)
+
+
+
+def test_unresolvable_annotation():
+    """Deserializes a class with a field whose annotation cannot be resolved
+    and expects the other fields to be resolved still."""
+    assert Unresolvable.deserialize({"a": "a"}) == Unresolvable(Path("a"))
+
+
+if __name__ == '__main__':
+    test_round_trip()
+    test_unresolvable_annotation()
@@ -1,9 +1,140 @@
 import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
 # noinspection PyUnresolvedReferences
 from typing import Union, Optional, List, Tuple
 
 from pyserial import SerialField, Serializable
+from pyserial.conversion.casting import add_caster
+from pyserial.conversion.serialization import add_serializer
+
+
+@dataclass
+class Nested(Serializable):
+    """This class is nested in the classes of the tests."""
+    f: int = SerialField(default=1)
+
+
+def test_round_trip():
+    """Serializes and deserializes a class with various annotations and expects to get an equal instance back."""
+    @dataclass
+    class A(Serializable):
+        a: str = SerialField()
+        b: int = SerialField()
+        c: Path = SerialField()
+        d: datetime.datetime = SerialField()
+        e: List[Nested] = SerialField()
+        f: Tuple[Optional[str]] = SerialField()
+        g: Nested = SerialField()
+
+    a = A("a", 1, Path("x"), datetime.datetime(2020, 1, 2), [Nested(1), Nested(2)], ("b", None), Nested(3))
+    data = a.serialize()
+    assert data == {
+        "a": "a", "b": 1, "c": "x", "d": "2020-01-02T00:00:00",
+        "e": [{"f": 1}, {"f": 2}], "f": ["b", None], "g": {"f": 3},
+    }
+    assert A.deserialize(data) == a
+
+
+def test_optional_fields():
+    """Deserializes optional fields with and without `None` and expects only non-`None` values to be cast."""
+    @dataclass
+    class A(Serializable):
+        a: Optional[int] = SerialField()
+        b: Optional[Nested] = SerialField()
+
+    assert A.deserialize({"a": None, "b": None}) == A(None, None)
+    assert A.deserialize({"a": "1", "b": {"f": 2}}) == A(1, Nested(2))
+
+
+def test_subclass_after_superclass():
+    """Uses a class first and then its subclass with an additional field
+    and expects each class to (de)serialize its own fields."""
+    @dataclass
+    class A(Serializable):
+        a: int = SerialField()
+
+    @dataclass
+    class AB(A):
+        b: str = SerialField()
+
+    assert A(1).serialize() == {"a": 1}
+    assert A.deserialize({"a": 1}) == A(1)
+    assert AB(1, "b").serialize() == {"a": 1, "b": "b"}
+    assert AB.deserialize({"a": 1, "b": "b"}) == AB(1, "b")
+    assert A(1).serialize() == {"a": 1}
+
+
+def test_excluded_fields():
+    """Expects fields with `serialize=False` to not be serialized but still be deserialized,
+    fields with `init=False` to be serialized but not be deserialized
+    and fields that are no `SerialField` to be neither."""
+    @dataclass
+    class A(Serializable):
+        a: int = SerialField(serialize=False)
+        b: int = SerialField(default=2, init=False)
+        c: int = field(default=3)
+
+    assert A(1).serialize() == {"b": 2}
+    assert A.deserialize({"a": "1", "b": 5, "c": 6}) == A(1)
+
+
+def test_no_serialized_fields():
+    """Serializes a class without any `SerialField` and expects an empty, unshared `dict`."""
+    @dataclass
+    class A(Serializable):
+        a: int = 1
+
+    data = A().serialize()
+    assert data == {}
+    data["a"] = 1
+    assert A().serialize() == {}
+    assert A.deserialize({}) == A()
+
+
+def test_deserialize_missing_key():
+    """Deserializes data that misses a field and expects a `KeyError`."""
+    @dataclass
+    class A(Serializable):
+        a: int = SerialField(default=1)
+
+    try:
+        A.deserialize({})
+    except KeyError:
+        ...
+    else:
+        raise AssertionError()
+
+
+def test_serialize_after_add_serializer():
+    """Serializes a class, then replaces the serializer for one of its fields
+    and expects the next serialization to use the new serializer."""
+    @dataclass
+    class A(Serializable):
+        a: int = SerialField()
+
+    assert A(1).serialize() == {"a": 1}
+    add_serializer(int, str)
+    try:
+        assert A(1).serialize() == {"a": "1"}
+    finally:
+        add_serializer(int, None)
+
+
+def test_deserialize_after_add_caster():
+    """Deserializes a class, then replaces the caster for one of its fields
+    and expects the next deserialization to use the new caster."""
+    class Int(int):
+        ...
+
+    @dataclass
+    class A(Serializable):
+        x: Int = SerialField()
+
+    assert A.deserialize({"x": 1}) == A(Int(1))
+    add_caster(Int, lambda value: Int(value) * 10)
+    assert A.deserialize({"x": "1"}) == A(Int(10))
+
 
 if __name__ == '__main__':
     import json
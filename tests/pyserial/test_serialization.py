@@ -1,8 +1,10 @@
+from abc import ABCMeta
+from functools import wraps
 from itertools import permutations
 # noinspection PyUnresolvedReferences
-from typing import Union, Optional, Any, Type, List, Tuple
+from typing import Union, Optional, Any, Type, List, Tuple, Callable
 
-from pyserial.conversion.serialization import add_serializer, _SERIALIZERS, get_serializer, serialize
+from pyserial.conversion.serialization import add_serializer, _reset_serializers, get_serializer, serialize, _SERIALIZERS
 
 
 class A():
@@ -17,6 +19,24 @@ class ABC(AB):
     ...
 
 
+def restore_serializers(test: Callable[[], None]) -> Callable[[], None]:
+    """Restores the serializers after the `test`, so tests that change or remove them
+    do not affect other tests relying on the builtin serializers."""
+
+    @wraps(test)
+    def inner():
+        serializers = dict(_SERIALIZERS)
+        try:
+            test()
+        finally:
+            _reset_serializers()
+            for type_, serializer in serializers.items():
+                add_serializer(type_, serializer)
+
+    return inner
+
+
+@restore_serializers
 def test_manage_serializer():
     """Blackbox test of `get_serializer()` and `add_serializer()`.
     Adds three classes, that are subclasses of one another to the serializers and when getting the serializer,
@@ -27,7 +47,7 @@ def test_manage_serializer():
     classes: List[Tuple[int, Type[A]]] = list(enumerate(classes))
 
     def test(sequence):
-        _SERIALIZERS.clear()
+        _reset_serializers()
         for type_, serializer in sequence:
             add_serializer(type_, serializer)
 
@@ -43,11 +63,12 @@ def test_manage_serializer():
         test(perm)
 
 
+@restore_serializers
 def test_get_serializer_superclass():
     """Tries to get the serializer for a subclass for which no serializer exists yet, but for its superclass."""
 
     def test(superclass, subclass):
-        _SERIALIZERS.clear()
+        _reset_serializers()
         add_serializer(superclass, lambda: 1)  # 1 As sentinel value for the proper serializer
         assert get_serializer(subclass)() == 1, f"{subclass =}, {superclass =}"
 
@@ -56,9 +77,10 @@ def test_get_serializer_superclass():
     test(AB, ABC)
 
 
+@restore_serializers
 def test_get_serializer_no_exist():
     """Tries to get the serializer for which no serializer exists and expects an error to get raised."""
-    _SERIALIZERS.clear()
+    _reset_serializers()
     try:
         add_serializer(int, lambda: 1)  # Add any non-matching serializer so the sequence is not empty.
         get_serializer(str)
@@ -67,16 +89,29 @@ def test_get_serializer_no_exist():
     else:
         raise AssertionError()
 
+@restore_serializers
+def test_get_serializer_after_add_serializer():
+    """Gets the serializer for a subclass before and after adding a serializer for that subclass
+    and expects the serializer of the subclass to be used afterwards."""
+    _reset_serializers()
+    add_serializer(A, lambda: 1)
+    assert get_serializer(AB)() == 1
+    add_serializer(AB, lambda: 2)
+    assert get_serializer(AB)() == 2
+
+
+@restore_serializers
 def test_serialize_callable():
     """Tries to serialize a value for which a callable serializer
     is defined and expects that callable to be used to modify the value."""
-    _SERIALIZERS.clear()
+    _reset_serializers()
     add_serializer(int, lambda _: 1)
     add_serializer(str, lambda _: "a")
 
     assert serialize(2) == 1
     assert serialize("b") == "a"
 
+@restore_serializers
 def test_serialize_none():
     """Tries to serialize a value for which the serializer is
     `None` and expects the serializer to leave the value as-is."""
@@ -87,9 +122,41 @@ def test_serialize_none():
     assert serialize("a") == "a"
 
 
+@restore_serializers
+def test_reset_serializers():
+    """Serializes a value, then resets the serializers
+    and expects the cached serializer of that value to be gone as well."""
+    add_serializer(str, None)
+    assert serialize("a") == "a"
+    _reset_serializers()
+    try:
+        get_serializer(str)
+    except ValueError:
+        ...
+    else:
+        raise AssertionError()
+
+
+
+@restore_serializers
+def test_get_serializer_registered_subclass():
+    """Adds a serializer for an ABC and expects a class that is only registered with that ABC to get its serializer."""
+    class Base(metaclass=ABCMeta):
+        ...
+
+    class Registered:
+        ...
+
+    Base.register(Registered)
+    add_serializer(Base, lambda _: 1)
+    assert serialize(Registered()) == 1
+
 if __name__ == '__main__':
     test_manage_serializer()
     test_get_serializer_superclass()
     test_get_serializer_no_exist()
+    test_get_serializer_after_add_serializer()
     test_serialize_callable()
-    test_serialize_none()
\ No newline at end of file
+    test_serialize_none()
+    test_reset_serializers()
+    test_get_serializer_registered_subclass()
\ No newline at end of file
@@ -1,3 +1,4 @@
+import sys
 # noinspection PyUnresolvedReferences
 from typing import Union, Optional, List, Tuple
 
@@ -29,6 +30,10 @@ def test_is_optional():
     test(Union[int, str], False)
     test(List[int], False)
     test(List[Optional[int]], False)
+    if sys.version_info >= (3, 9):
+        from typing import Annotated
+        test(Annotated[int, []], False)
+        # ↑ Cannot be hashed due to its metadata.
     # endregion
 
 
@@ -42,26 +47,29 @@ def test_is_singular_optional():
     test(Optional[Union[int, str]], False)
     test(Optional, False)
     test(Union[int, str, None], False)
+    if sys.version_info >= (3, 9):
+        from typing import Annotated
+        test(Annotated[int, []], False)
 
 
 def test_type_to_list():
     """Tests that different nestings and singular optionals get converted correctly."""
 
-    def test(type_, expected_list):
-        assert type_to_list(type_) == expected_list
+    def test(type_, expected_tuple):
+        assert type_to_list(type_) == expected_tuple
 
     # region: Different nesting depths
-    test(int, [int])
-    test(List[int], [list, int])
-    test(List[Tuple[int]], [list, tuple, int])
-    test(List[Tuple[List[int]]], [list, tuple, list, int])
+    test(int, (int,))
+    test(List[int], (list, int))
+    test(List[Tuple[int]], (list, tuple, int))
+    test(List[Tuple[List[int]]], (list, tuple, list, int))
     # endregion
     # region: Optionals
-    test(Optional[int], [(int, None)])
-    test(Union[int, None], [(int, None)])
-    test(Union[None, int], [(int, None)])
+    test(Optional[int], ((int, None),))
+    test(Union[int, None], ((int, None),))
+    test(Union[None, int], ((int, None),))
 
-    test(List[Optional[int]], [list, (int, None)])
+    test(List[Optional[int]], (list, (int, None)))
     # endregion
 
 